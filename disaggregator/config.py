@@ -113,8 +113,11 @@ def database_raw(query, force_update=False):
 
 def clear_local_cache():
     """
-    Clear the local query cache.
+    Clear the local query cache and the in-memory caches of the data
+    functions.
     """
+    from .data import clear_memory_cache
+    clear_memory_cache()
     # Check if caching directory exists and create if not.
     if not os.path.isdir(data_in('__cache__/')):
         os.mkdir(data_in('__cache__/'))
@@ -24,6 +24,7 @@ import numpy as np
 import logging
 import holidays
 import datetime
+import functools
 from collections import OrderedDict
 from collections.abc import Iterable
 from .config import (get_config, data_in, data_out, database_raw,
@@ -33,9 +34,53 @@ logger = logging.getLogger(__name__)
 cfg = get_config()
 
 
+def memoize(func):
+    """
+    Keep the return values of a data function in memory for repeated calls
+    with the same arguments. Copies are handed out, so that the callers may
+    alter the results without corrupting the memory cache.
+
+    The results are cached per Python process. The current state of `cfg`
+    is part of the cache key, so that changes of the configuration during a
+    session (e.g. `base_year` or a `source`) lead to a fresh read.
+    Passing `force_update=True` clears the memory cache of the function,
+    so that also later calls without it return the refreshed data. All
+    memory caches are cleared by `clear_memory_cache()` as well as by
+    `config.clear_local_cache()`.
+    """
+    cache = {}
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if kwargs.get('force_update', False):
+            cache.clear()
+        key = repr((args, sorted((k, v) for k, v in kwargs.items()
+                                 if k != 'force_update'), cfg))
+        if key not in cache:
+            cache[key] = func(*args, **kwargs)
+        ret = cache[key]
+        return ret.copy() if hasattr(ret, 'copy') else ret
+
+    wrapper.cache_clear = cache.clear
+    memoized_functions.append(wrapper)
+    return wrapper
+
+
+memoized_functions = []
+
+
+def clear_memory_cache():
+    """
+    Clear the in-memory caches of all memoized data functions.
+    """
+    for func in memoized_functions:
+        func.cache_clear()
+
+
 # --- Dimensionless data ------------------------------------------------------
 
 
+@memoize
 def elc_consumption_HH(by_HH_size=False, **kwargs):
     """
     Read and return electricity consumption for households (HH) in [MWh/a].
@@ -88,6 +133,7 @@ def elc_consumption_HH(by_HH_size=False, **kwargs):
     return df
 
 
+@memoize
 def heat_consumption_HH(by='households', **kwargs):
     """
     Read and return heat consumption for households (HH) in [MWh/a] as
@@ -774,6 +820,7 @@ def generate_specific_consumption_per_branch_and_district(iterations_power=8,
 # --- Spatial data ------------------------------------------------------------
 
 
+@memoize
 def population(**kwargs):
     """
     Read, transform and return the number of residents per NUTS-3 area.
@@ -856,6 +903,7 @@ def elc_consumption_HH_spatial(**kwargs):
     return df
 
 
+@memoize
 def households_per_size(original=False, **kwargs):
     """
     Read, transform and return the numbers of households for each household
@@ -912,6 +960,7 @@ def households_per_size(original=False, **kwargs):
     return df
 
 
+@memoize
 def living_space(aggregate=True, **kwargs):
     """
     Read, transform and return a DataFrame with the available living space
@@ -1055,6 +1104,7 @@ def percentage_EFH_MFH(MFH=False, **kwargs):
         return df
 
 
+@memoize
 def income(**kwargs):
     """
     Read, transform and return incomes in [Euro/cap] per NUTS-3 area.
@@ -1173,6 +1223,7 @@ def energy_balance_values(**kwargs):
     return df
 
 
+@memoize
 def stove_assumptions(**kwargs):
     """
     Return assumptions of shares and efficencies of gas and electric stoves
@@ -1195,6 +1246,7 @@ def stove_assumptions(**kwargs):
     return df
 
 
+@memoize
 def hotwater_shares(**kwargs):
     """
     Return assumptions of shares and efficencies of gas and electric stoves
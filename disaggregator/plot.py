@@ -146,6 +146,8 @@ def choropleth_map(df, cmap='viridis', interval=None, annotate=None,
     i, j = [0, 0]
     fig, ax = plt.subplots(nrows=nrows, ncols=ncols, squeeze=False,
                            figsize=figsize)
+    # Plain dicts per region for the annotations (much cheaper than iterrows)
+    records = list(zip(DF.index, DF.to_dict('records')))
     for a, col in enumerate(cols):
         if j == ncols:
             i += 1
@@ -175,7 +177,7 @@ def choropleth_map(df, cmap='viridis', interval=None, annotate=None,
         ax[i, j].get_xaxis().set_visible(False)
         ax[i, j].get_yaxis().set_visible(False)
         # Add annotations
-        for idx, row in DF.iterrows():
+        for idx, row in records:
             s = ''
             for a, ann in enumerate(annotate):
                 if a >= 1:
@@ -183,7 +185,7 @@ def choropleth_map(df, cmap='viridis', interval=None, annotate=None,
                 if ann == 'nuts3':
                     s += idx
                 if ann in ['name', 'names']:
-                    s += row.gen
+                    s += row['gen']
                 if ann in ['value', 'values']:
                     s += ('' if np.isnan(row[col])
                           else '{:.0f}'.format(row[col]))
@@ -259,7 +261,7 @@ def heatmap_timeseries(df, **kwargs):
 
     fig, ax = plt.subplots(figsize=figsize, nrows=nrows, ncols=1, sharex=True,
                            squeeze=False)
-    for col, ser in df.iteritems():
+    for col, ser in df.items():
         dfs = pd.DataFrame(np.array(ser).reshape(days, hours)).T
         cax = ax[i, j].imshow(dfs, interpolation='nearest', cmap=cmap,
                               vmin=vmin, vmax=vmax)
@@ -354,14 +356,14 @@ def multireg_generic(df, **kwargs):
                           xlabel=xlabel)
             if show_means:
                 s = [u'∅ {}: {:+.2f} {}'.format(c, col.mean(), unit)
-                     for c, col in df[reg].iteritems()]
+                     for c, col in df[reg].items()]
                 txt = AnchoredText('\n'.join(s), loc=means_loc,
                                    prop={'size': 12})
                 txt.patch.set(boxstyle='round', alpha=0.5)
                 ax[i, j].add_artist(txt)
             j += 1
     else:
-        for reg, col in df.iteritems():
+        for reg, col in df.items():
             if j == ncols:
                 i += 1
                 j = 0
@@ -64,7 +64,8 @@ def disagg_households_power(by, weight_by_income=False, original=False,
     elif by == 'population':
         # Top-Down: Power demand for entire country in [GWh/a]
         power_nuts0 = elc_consumption_HH(year=year) / 1e3
-        distribution_keys = population(year=year) / population(year=year).sum()
+        df_pop = population(year=year)
+        distribution_keys = df_pop / df_pop.sum()
         df = distribution_keys * power_nuts0
     else:
         raise ValueError("`by` must be in ['households', 'population']")
@@ -97,13 +98,16 @@ def disagg_households_heat(by, weight_by_income=False, **kwargs):
                          '"buildings".')
 
     # Bottom-Up: Heat demand by household sizes in [MWh/a]
-    df_heat_specific = heat_consumption_HH(by=by, year=year).T.unstack()
-    df = pd.DataFrame(columns=df_heat_specific.index)
+    df_heat_specific = heat_consumption_HH(by=by, year=year)
+    names = [df_heat_specific.index.name, df_heat_specific.columns.name]
     base = households_per_size() if by == 'households' else living_space()
-    for col, ser in base.iteritems():
-        for idx in heat_consumption_HH(by=by, year=year).index:
-            df.loc[:, (idx, col)] = ser
-    df *= df_heat_specific
+    df_heat_specific = df_heat_specific.reindex(columns=base.columns)
+    # Outer product: regions x applications x (household sizes | buildings)
+    values = base.values[:, None, :] * df_heat_specific.values[None, :, :]
+    columns = pd.MultiIndex.from_product([df_heat_specific.index,
+                                          base.columns], names=names)
+    df = pd.DataFrame(values.reshape(len(base), -1), index=base.index,
+                      columns=columns)
     return df
 
 
@@ -143,10 +147,11 @@ def disagg_households_gas(how='top-down', weight_by_income=False,
         logger.info('Calculating regional gas demands top-down.')
         d_keys_space = df_ls_gas / df_ls_gas.sum()
         # Calculate
-        df = (pd.DataFrame(index=df_ls_gas.index)
-                .assign(Cooking=d_keys_cook * gas_nuts0['Cooking'],
-                        HotWater=d_keys_hotwater * gas_nuts0['HotWater'],
-                        SpaceHeating=d_keys_space * gas_nuts0['SpaceHeating']))
+        df = pd.DataFrame({'Cooking': d_keys_cook * gas_nuts0['Cooking'],
+                           'HotWater': d_keys_hotwater * gas_nuts0['HotWater'],
+                           'SpaceHeating': (d_keys_space
+                                            * gas_nuts0['SpaceHeating'])},
+                          index=df_ls_gas.index)
 
     elif how == 'bottom-up':
         logger.info('Calculating regional gas demands bottom-up.')
@@ -208,10 +213,10 @@ def disagg_households_gas(how='top-down', weight_by_income=False,
         df_erg = piv_dem.multiply(piv_m2) / 0.99  # eta-boiler assumption
         df_spaceheat = df_erg.sum(axis=1)
         # Calculate
-        df = (pd.DataFrame(index=df_spaceheat.index)
-                .assign(Cooking=d_keys_cook * gas_nuts0['Cooking'],
-                        HotWater=d_keys_hotwater * gas_nuts0['HotWater'],
-                        SpaceHeating=df_spaceheat))
+        df = pd.DataFrame({'Cooking': d_keys_cook * gas_nuts0['Cooking'],
+                           'HotWater': d_keys_hotwater * gas_nuts0['HotWater'],
+                           'SpaceHeating': df_spaceheat},
+                          index=df_spaceheat.index)
 
     elif how == 'bottom-up_2':
         logger.warning("This feature is currently experimental and should not "
@@ -222,42 +227,43 @@ def disagg_households_gas(how='top-down', weight_by_income=False,
         logger.info('Calculating regional gas demands bottom-up:')
         logger.info('1. Cooking based on household sizes in [MWh/a]')
         df_stove = stove_assumptions()
+        f_cook = (df_stove.stoves_percentage_gas
+                  / df_stove.stoves_efficiency_gas)
         df_heat_cook = pd.DataFrame(df_heat_dem['Cooking'])
-        for idx, row in df_stove.iterrows():
-            df_heat_cook.update(df_heat_cook.filter(axis=0, regex=idx)
-                                * row.stoves_percentage_gas
-                                / row.stoves_efficiency_gas)
+        df_heat_cook = df_heat_cook.multiply(
+            map_nuts1(df_heat_cook.index, f_cook), axis=0)
 
         logger.info('2. Hot water (decentralised) based on household sizes'
                     ' in [MWh/a]')
         df_WW_shares = hotwater_shares()
+        f_WW = df_WW_shares.share_decentralised_gas / 0.95  # eta gas boilers
         df_WW = pd.DataFrame(df_heat_dem['HotWater'])
-        for idx, row in df_WW_shares.iterrows():
-            df_WW.update(df_WW.filter(axis=0, regex=idx)
-                         * row.share_decentralised_gas
-                         / 0.95)  # efficiency assumption gas boilers
+        df_WW = df_WW.multiply(map_nuts1(df_WW.index, f_WW), axis=0)
 
         logger.info('3. Space heating + hot water (centralised) based on '
                     'living space in [MWh/a]')
 
-        df_hc_only = (heat_consumption_HH(by='buildings')
-                      .T.loc[:, 'SpaceHeatingOnly'])
-        df_hc_HW = (heat_consumption_HH(by='buildings')
-                    .T.loc[:, 'SpaceHeatingPlusHotWater'])
-        df_spaceheat = df_ls_gas.multiply(df_hc_only)
-        df_spaceheat_HW = df_ls_gas.multiply(df_hc_HW)
-        for idx, row in df_WW_shares.iterrows():
-            df_spaceheat.update(df_spaceheat.filter(axis=0, regex=idx)
-                                * (1.0 - row.share_centralised))
-            df_spaceheat_HW.update(df_spaceheat_HW.filter(axis=0, regex=idx)
-                                   * row.share_centralised)
+        df_hc = heat_consumption_HH(by='buildings').T
+        df_hc_only = df_hc.loc[:, 'SpaceHeatingOnly']
+        df_hc_HW = df_hc.loc[:, 'SpaceHeatingPlusHotWater']
+        # gas-heated living space per building type in [m²]
+        df_ls_bt = (living_space(aggregate=True,
+                                 internal_id=[None, None, 11, 1])
+                    .reindex(columns=df_hc.index))
+        share_central = map_nuts1(df_ls_bt.index,
+                                  df_WW_shares.share_centralised)
+        df_spaceheat = (df_ls_bt.multiply(df_hc_only)
+                                .multiply(1.0 - share_central, axis=0))
+        df_spaceheat_HW = (df_ls_bt.multiply(df_hc_HW)
+                                   .multiply(share_central, axis=0))
 
         logger.info('4. Merging results')
-        df = (pd.DataFrame(index=df_heat_dem.index)
-                .assign(Cooking=df_heat_cook.sum(axis=1),
-                        HotWaterDecentral=df_WW.sum(axis=1),
-                        SpaceHeatingOnly=df_spaceheat.sum(axis=1),
-                        SpaceHeatingPlusHotWater=df_spaceheat_HW.sum(axis=1)))
+        df = pd.DataFrame({'Cooking': df_heat_cook.sum(axis=1),
+                           'HotWaterDecentral': df_WW.sum(axis=1),
+                           'SpaceHeatingOnly': df_spaceheat.sum(axis=1),
+                           'SpaceHeatingPlusHotWater':
+                               df_spaceheat_HW.sum(axis=1)},
+                          index=df_heat_dem.index)
 
     if weight_by_income:
         df = adjust_by_income(df=df)
@@ -333,10 +339,36 @@ def disagg_CTS_industry(source, sector,
 
 def adjust_by_income(df, **kwargs):
     year = kwargs.get('year', cfg['base_year'])
-    income_keys = income(year=year) / income(year=year).mean()
+    df_income = income(year=year)
+    income_keys = df_income / df_income.mean()
     return df.multiply(income_keys, axis=0)
 
 
+def map_nuts1(index, values, fill_value=1.0):
+    """
+    Broadcast NUTS-1 values onto a NUTS-3 index.
+
+    Parameters
+    ----------
+    index : pd.Index
+        index: nuts3-codes
+    values : pd.Series
+        index: nuts1-codes
+    fill_value : float, default 1.0
+        The value for regions without a matching NUTS-1 code.
+
+    Returns
+    -------
+    pd.Series
+        index: nuts3-codes
+    """
+    # The NUTS-1 code is the fixed-width prefix of the NUTS-3 code. Encode
+    # it as categorical, so that only the categories need to be looked up.
+    nuts1 = pd.Categorical(index.astype(str).str[0:3])
+    factors = values.reindex(nuts1.categories).fillna(fill_value).values
+    return pd.Series(factors[nuts1.codes], index=index)
+
+
 def aggregate_to_nuts1(df, agg='sum'):
     """
     Re-aggregate to NUTS-1 level from NUTS-3 level data.
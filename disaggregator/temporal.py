@@ -41,7 +41,8 @@ logger = logging.getLogger(__name__)
 cfg = get_config()
 
 
-def disagg_temporal(spat, temp, time_indexed=False, **kwargs):
+def disagg_temporal(spat, temp, time_indexed=False, dtype=np.float64,
+                    **kwargs):
     """
     Disagreggate spatial data temporally through one or a set of spatial time
     series.
@@ -56,6 +57,9 @@ def disagg_temporal(spat, temp, time_indexed=False, **kwargs):
         If pd.DataFrame: NUTS-3-index'ed
     time_indexed : bool, default False
         Option to return the timesteps in index and regions in columns
+    dtype : np.dtype, default np.float64
+        Data type of the results. np.float32 halves the memory footprint,
+        which is worth considering for 15-min resolved results.
 
     """
     # Make sure spat is a pd.DataFrame and determine dimension
@@ -68,19 +72,34 @@ def disagg_temporal(spat, temp, time_indexed=False, **kwargs):
     if isinstance(temp, pd.Series):
         # Simple time series to be applied to all regions
         temp /= temp.sum()  # Normalize temporal data
+        t_vals = temp.values.astype(dtype, copy=False)
+        s_vals = spat.values.astype(dtype, copy=False)
         if time_indexed:
-            return pd.DataFrame(np.outer(temp, spat),
+            return pd.DataFrame(np.multiply.outer(t_vals, s_vals),
                                 index=temp.index, columns=spat.index)
         else:
-            return pd.DataFrame(np.outer(spat, temp),
+            return pd.DataFrame(np.multiply.outer(s_vals, t_vals),
                                 index=spat.index, columns=temp.index)
     elif isinstance(temp, pd.DataFrame):
         # Exising time series for all regions
-        temp = temp.div(temp.sum(axis=1), axis='index')  # Normalize
+        if not spat.index.equals(temp.index):
+            # Let pandas align e.g. multi-indexed or differing regions
+            df = (temp.div(temp.sum(axis=1), axis='index')
+                      .multiply(spat, axis=0)
+                      .astype(dtype))
+            return df.T if time_indexed else df
+        # Normalize and scale with one factor per region in a single pass
+        factor = spat.values / temp.sum(axis=1).values
         if time_indexed:
-            return temp.multiply(spat, axis=0).T
+            values = np.array(temp.values.T, dtype=dtype, order='C')
+            values *= factor
+            return pd.DataFrame(values, index=temp.columns,
+                                columns=temp.index)
         else:
-            return temp.multiply(spat, axis=0)
+            values = np.array(temp.values, dtype=dtype, order='C')
+            values *= factor[:, None]
+            return pd.DataFrame(values, index=temp.index,
+                                columns=temp.columns)
     else:
         raise ValueError('`temp` must be either a pd.Series or a '
                          'one-level-indexed (!) pd.DataFrame.')
@@ -118,7 +137,7 @@ def make_zve_load_profiles(return_profile_by_typeday=False,
     df_perc_app = zve_percentages_applications()
     df_app_prof = zve_application_profiles()
     df_perc_baseload = zve_percentages_baseload()
-    df_perc_activityload = df_perc_baseload.apply(lambda x: 1-x)
+    df_perc_activityload = 1 - df_perc_baseload
 
     nTsLP = 96  # number of time steps in load profiles
     df_baseload = (df_perc_baseload * df_perc_app) / float(nTsLP)
@@ -146,37 +165,51 @@ def make_zve_load_profiles(return_profile_by_typeday=False,
                    'SA_Win', 'SA_Tra', 'SA_Sum',
                    'SU_Win', 'SU_Tra', 'SU_Sum']
     n_ts = len(time_slices_to_days)  # number of time slices
+    ts_season = np.arange(n_ts) % 3  # season of each time slice
+    ts_days = np.array([time_slices_to_days[ts] for ts in time_slices])
+    # Application profiles of shape (Time, Application, TimeSlice, HH_size)
+    # with TimeSlice = (Day-1)*3 + Season-1
+    app_prof = (df_app_prof.set_index(['HH_size', 'Day', 'Season',
+                                       'Application'])
+                           .sort_index()
+                           .iloc[:, 0:nTsLP].values
+                           .reshape(n_HH, n_ts, n_app_activity, nTsLP)
+                           .transpose(3, 2, 1, 0))
 
     DE = database_shapes()
     assert(isinstance(DE, gpd.GeoDataFrame))
-    # Derive lat/lon tuple as representative point for each shape
-    DE['coords'] = DE.to_crs({'init': 'epsg:4326'}).geometry.apply(
-        lambda x: x.representative_point().coords[:][0])
+    # Derive lat/lon as representative point for each shape
+    rp = DE.to_crs(epsg=4326).representative_point()
+    DE['lon'], DE['lat'] = rp.x.values, rp.y.values
     idx = pd.date_range(start='{}-01-01'.format(year),
                         end='{}-12-31 23:00'.format(year), freq='1H')
     if reg is not None:
         DE = DE.loc[reg].to_frame().T
-    DF = pd.DataFrame(index=idx, columns=DE.index)
-    for region, row in DE.iterrows():
-        logger.info('Creating ZVE-profile for {} ({})'.format(row['gen'], region))
-        lat = row.coords[1]
-        lon = row.coords[0]
-        prob_night = probability_light_needed(lat=lat, lon=lon, nTsLP=nTsLP)
+    # Probability of needed light for all regions at once
+    prob_night_all = probability_light_needed(lat=DE['lat'], lon=DE['lon'],
+                                              nTsLP=nTsLP)
+    # Hour, type day and season of each time step in the given year
+    dic_month_to_season = {1: 'Win', 2: 'Win', 3: 'Win', 4: 'Tra',
+                           5: 'Sum', 6: 'Sum', 7: 'Sum', 8: 'Sum',
+                           9: 'Tra', 10: 'Tra', 11: 'Win', 12: 'Win'}
+    dic_day_to_typeday = {0: 'WD', 1: 'WD', 2: 'WD', 3: 'WD', 4: 'WD',
+                          5: 'SA', 6: 'SU'}
+    hours = idx.hour.values
+    cols_year = pd.MultiIndex.from_arrays(
+        [idx.dayofweek.map(dic_day_to_typeday),
+         idx.month.map(dic_month_to_season)])
+    DF = pd.DataFrame(0.0, index=idx, columns=DE.index)
+    for region, name in DE['gen'].items():
+        logger.info('Creating ZVE-profile for {} ({})'.format(name, region))
+        prob_night = prob_night_all.loc[region]
 
         time_idx = pd.date_range(start='2012-01-02 00:00:00',
                                  end='2012-01-02 23:45:00', freq='15Min')
-        LP_15 = xr.DataArray(np.zeros((nTsLP, n_app_activity, n_ts, n_HH)),
+        LP_15 = xr.DataArray(app_prof.astype(float),
                              dims=['Time', 'Application',
                                    'TimeSlice', 'HH_size'],
                              coords=[time_idx, df_perc_app.index[0:9],
                                      time_slices, df_HH.columns])
-        for HH_size, df_HH_size in df_app_prof.groupby('HH_size'):
-            for id_day, df_day in df_HH_size.groupby('Day'):
-                for id_season, df_season in df_day.groupby('Season'):
-                    id_ts = (id_day-1)*3 + id_season - 1
-                    for id_app, df_app in df_season.groupby('Application'):
-                        LP_15[:, id_app-1, id_ts, HH_size-1] = (
-                            df_app.iloc[0, 4:100])
 
         LP_Fin = xr.DataArray(np.zeros((nTsLP, n_app_all, n_ts), dtype=float),
                               dims=['Time', 'Application', 'TimeSlice'],
@@ -186,21 +219,18 @@ def make_zve_load_profiles(return_profile_by_typeday=False,
                                dims=['Time', 'TimeSlice', 'HH_size'],
                                coords=[time_idx, time_slices, df_HH.columns])
 
+        # Multiplication of a person's presence (activity_id = 0) with the
+        # probability of night, which gives the probability of needed light
+        LP_light = LP_15.values[:, 0, :, :]  # view of shape (Time, TS, HH)
+        LP_light *= prob_night.values[:, ts_season][:, :, None]
+        year_sum = ts_days @ LP_light.sum(axis=0)
+        # Light (i_app=0) needs to be normalized to a daily sum = 1.
+        LP_light *= 366.0 / year_sum
+
         for i_HH, HH_size in enumerate(df_elc_HH.columns):
             logger.info('Calc load profile for household-size: {}'
                         .format(HH_size))
 
-            # Multiplication of a person's presence (activity_id = 0) with the
-            # probability of night, which gives the probability of needed light
-            year_sum = 0.0
-            for i_ts, ts in enumerate(time_slices):
-                j = i_ts % 3
-                LP_15[:, 0, i_ts, i_HH] *= prob_night[:, j]
-                year_sum += (LP_15[:, 0, i_ts, i_HH].sum(axis=0).item()
-                             * time_slices_to_days[ts])
-            # Light (i_app=0) needs to be normalized to a daily sum = 1.
-            LP_15[:, 0, :, i_HH] *= 366.0 / year_sum
-
             # Normalize something.
             # TODO: Understand what is intended here - just copy&pasted yet.
             norm_factor_0 = (nTsLP / 24.) * 1000000. / 366.
@@ -235,25 +265,10 @@ def make_zve_load_profiles(return_profile_by_typeday=False,
         # Resample to hourly values:
         df_erg = df_erg.resample('1H').sum().reset_index(drop=True)
         # Create a 8760-hour time series out of these profiles for given year
-        dic_month_to_season = {1: 'Win', 2: 'Win', 3: 'Win', 4: 'Tra',
-                               5: 'Sum', 6: 'Sum', 7: 'Sum', 8: 'Sum',
-                               9: 'Tra', 10: 'Tra', 11: 'Win', 12: 'Win'}
-        dic_day_to_typeday = {0: 'WD', 1: 'WD', 2: 'WD', 3: 'WD', 4: 'WD',
-                              5: 'SA', 6: 'SU'}
-        df_new = (pd.DataFrame(index=idx)
-                    .assign(Season=lambda x: x.index.month,
-                            TypeDay=lambda x: x.index.dayofweek,
-                            Hour=lambda x: x.index.hour)
-                    .replace(dict(Season=dic_month_to_season))
-                    .replace(dict(TypeDay=dic_day_to_typeday)))
-        # assign values # TODO: this is comparatively slow, make more efficient
-        for i in idx:
-            ind = df_new.loc[i, 'Hour']
-            col = (df_new.loc[i, 'TypeDay'], df_new.loc[i, 'Season'])
-            df_new.loc[i, 'value'] = df_erg.loc[ind, col]
+        # by positional lookup of (hour, (type day, season)) for each hour
+        values = df_erg.values[hours, df_erg.columns.get_indexer(cols_year)]
         # generate distribution keys
-        df_new = df_new['value'] / df_new['value'].sum()
-        DF.loc[:, region] = df_new
+        DF.loc[:, region] = values / values.sum()
 
     # Looping over all regions is done. Now save and return
     if reg is None:
@@ -308,22 +323,21 @@ def getSunsetSunrise(doy, lat, lon, UTC_diff):
 
     Parameters
     ----------
-    doy : int
+    doy : int or np.ndarray
         day of year
     lat : float
         latitute
     lon : float
         longitude
-    UTC_diff : int
+    UTC_diff : int or np.ndarray
         difference to UTC
 
     Returns
     -------
     tuple
     """
-    import math
-    B = math.pi * lat / 180
-    declination_sun = 0.4095 * math.sin(0.016906 * (doy-80.086))
+    B = np.pi * lat / 180
+    declination_sun = 0.4095 * np.sin(0.016906 * (doy-80.086))
 
     # elevation angle at which there is dawn (i.e. daylight available)
     # civil dawn:         -6° below horizon
@@ -333,15 +347,15 @@ def getSunsetSunrise(doy, lat, lon, UTC_diff):
     # sunrise/sunset hours.
     light_h = 12.
     # Transform into radiants
-    sunset_h = light_h/(180/math.pi)
+    sunset_h = light_h/(180/np.pi)
     # time difference
-    time_diff_arg = ((math.sin(sunset_h)
-                      - math.sin(B) * math.sin(declination_sun))
-                     / (math.cos(B) * math.cos(declination_sun)))
-    time_diff_arg = min(time_diff_arg, 1.)
-    time_diff = 12 * math.acos(time_diff_arg) / math.pi
-    time_equation = (-0.171 * math.sin(0.0337*doy + 0.465)
-                     - 0.1299 * math.sin(0.01787*doy - 0.168))
+    time_diff_arg = ((np.sin(sunset_h)
+                      - np.sin(B) * np.sin(declination_sun))
+                     / (np.cos(B) * np.cos(declination_sun)))
+    time_diff_arg = np.clip(time_diff_arg, -1., 1.)
+    time_diff = 12 * np.arccos(time_diff_arg) / np.pi
+    time_equation = (-0.171 * np.sin(0.0337*doy + 0.465)
+                     - 0.1299 * np.sin(0.01787*doy - 0.168))
     # Sunrise / sunset at central local time (MOZ)
     sunset_MOZ = 12 + time_diff - time_equation
     sunrise_MOZ = 12 - time_diff - time_equation
@@ -360,21 +374,26 @@ def probability_light_needed(lat, lon, nTsLP=96):
 
     Parameters
     ----------
-    lat : float
-        latitute
-    lon : float
-        longitude
+    lat : float or array-like
+        latitute(s)
+    lon : float or array-like
+        longitude(s)
     nTsLP : int, default 96
         number of time steps in load profiles
 
     Returns
     -------
     xr.DataArray
+        dims: ['Time', 'Season'] if `lat` and `lon` are scalars, else
+              ['Region', 'Time', 'Season'] with the index of `lat` as
+              regions if given as pd.Series.
     """
-    lat, lon = float(lat), float(lon)
+    scalar = np.ndim(lat) == 0
+    regions = lat.index if isinstance(lat, pd.Series) else None
+    lat = np.asarray(lat, dtype=float).reshape(-1, 1)
+    lon = np.asarray(lon, dtype=float).reshape(-1, 1)
     # -- Static values for the year 2012 in which evaluation was carried out --
     month_lengths = [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-    month_first_day = [0] + np.cumsum(month_lengths[:-1]).tolist()
     SummerTimeBegin = 87  # only valid for 2012
     WinterTimeBegin = 301  # only valid for 2012
     # -------------------------------------------------------------------------
@@ -387,36 +406,46 @@ def probability_light_needed(lat, lon, nTsLP=96):
 
     time_idx = pd.date_range(start='2012-01-02 00:00:00',
                              end='2012-01-02 23:45:00', freq='15Min')
-    p_night = xr.DataArray(np.zeros((nTsLP, len(seasons)), dtype=np.float32),
-                           dims=['Time', 'Season'],
-                           coords=[time_idx, list(range(3))])
-
-    for season_id, season in enumerate(seasons):
-        iadd = 0
-        for m in season_months[season]:
-            iadd += month_lengths[m-1]  # Count of days in the season
-        add = 1./float(iadd)  # Percentage of one day in that season
-        TsH = nTsLP / 24.  # Number of time steps per Hour
-        for m in season_months[season]:
-            doy = float(month_first_day[m-1])  # doy is 'day of year'
-            for d in range(0, month_lengths[m-1]):
-                doy += 1.
-                # min(max(doy-SummerTimeBegin,0),1)-min(max(doy-WinterTimeBegin,0),1)
-                # gives 1 during summer time, else 0
-                UTC_diff = float(timezone + min(max(doy-SummerTimeBegin, 0), 1)
-                                 - min(max(doy-WinterTimeBegin, 0), 1))
-                sunset, sunrise = getSunsetSunrise(doy, lat, lon, UTC_diff)
-                # NEnd, NBeg are integer indices of the nTsLP
-                # sunrise + hoursBeforeSunset :
-                # Light is needed until 'hoursBeforeSunset' after sunrise
-                # sunset - hoursBeforeSunset :
-                # Light is needed 'hoursBeforeSunset' until sunset
-                NEnd = int((sunrise+hoursBeforeSunset)*TsH)  # round floor
-                NBeg = int((sunset-hoursBeforeSunset)*TsH+0.999)  # round ceil
-                p_night[0:NEnd, season_id] += add
-                p_night[NBeg:nTsLP, season_id] += add
-
-    return p_night
+    TsH = nTsLP / 24.  # Number of time steps per Hour
+    doy = np.arange(1, sum(month_lengths) + 1, dtype=float)  # 'day of year'
+    month = np.repeat(np.arange(1, 13), month_lengths)
+    # clip(doy-SummerTimeBegin,0,1)-clip(doy-WinterTimeBegin,0,1)
+    # gives 1 during summer time, else 0
+    UTC_diff = (timezone + np.clip(doy-SummerTimeBegin, 0, 1)
+                - np.clip(doy-WinterTimeBegin, 0, 1))
+    # sunset, sunrise of shape (regions, days)
+    sunset, sunrise = getSunsetSunrise(doy, lat, lon, UTC_diff)
+    # NEnd, NBeg are integer indices of the nTsLP
+    # sunrise + hoursBeforeSunset :
+    # Light is needed until 'hoursBeforeSunset' after sunrise
+    # sunset - hoursBeforeSunset :
+    # Light is needed 'hoursBeforeSunset' until sunset
+    NEnd = ((sunrise+hoursBeforeSunset)*TsH).astype(int)  # round floor
+    NBeg = ((sunset-hoursBeforeSunset)*TsH+0.999).astype(int)  # round ceil
+    # Season and percentage of one day in that season for each day
+    season_id = np.zeros(len(doy), dtype=int)
+    add = np.zeros(len(doy), dtype=np.float32)
+    for i, season in enumerate(seasons):
+        in_season = np.isin(month, season_months[season])
+        season_id[in_season] = i
+        add[in_season] = 1./float(in_season.sum())
+
+    # Each day adds its percentage to the time steps [0, NEnd) and
+    # [NBeg, nTsLP). Write these as steps into a contiguous difference
+    # buffer, which is integrated along the time steps afterwards.
+    p_night = np.zeros((len(lat), nTsLP + 1, len(seasons)), dtype=np.float32)
+    reg_id = np.arange(len(lat))[:, None]
+    np.add.at(p_night, (reg_id, 0, season_id), add)
+    np.add.at(p_night, (reg_id, np.clip(NEnd, 0, nTsLP), season_id), -add)
+    np.add.at(p_night, (reg_id, np.clip(NBeg, 0, nTsLP), season_id), add)
+    p_night = np.ascontiguousarray(p_night.cumsum(axis=1)[:, :nTsLP])
+    if scalar:
+        return xr.DataArray(p_night[0], dims=['Time', 'Season'],
+                            coords=[time_idx, list(range(3))])
+    if regions is None:
+        regions = list(range(len(lat)))
+    return xr.DataArray(p_night, dims=['Region', 'Time', 'Season'],
+                        coords=[regions, time_idx, list(range(3))])
 
 
 def disagg_temporal_power_CTS(detailed=False, use_nuts3code=False, **kwargs):
@@ -461,7 +490,7 @@ def disagg_temporal_power_CTS(detailed=False, use_nuts3code=False, **kwargs):
             sv_lk_wz_ts = pd.DataFrame(index=idx)
         else:
             cols = sv_lk_wz.drop(columns=['SLP']).columns
-            sv_lk_ts = pd.DataFrame(index=idx, columns=cols).fillna(0.0)
+            sv_lk_ts = pd.DataFrame(0.0, index=idx, columns=cols)
 
         logger.info('... assigning load-profiles to WZs')
         for slp in sv_lk_wz['SLP'].unique():
@@ -570,7 +599,7 @@ def disagg_temporal_power_housholds_slp(use_nuts3code=False,
         assert slp_bl.index.equals(idx), "The time-indizes are not aligned"
         # Create 15min-index'ed DataFrames for current state
         cols = sv_lk.drop(columns=['SLP']).columns
-        sv_lk_ts = pd.DataFrame(index=idx, columns=cols).fillna(0.0)
+        sv_lk_ts = pd.DataFrame(0.0, index=idx, columns=cols)
 
         logger.info('... assigning load-profiles')
         # Calculate load profile for each LK
@@ -843,16 +872,16 @@ def disagg_temporal_gas_CTS(detailed=False, use_nuts3code=False, **kwargs):
             tw_df_lk.index = pd.DatetimeIndex(tw_df_lk.index)
             last_hour = tw_df_lk.copy()[-1:]
             last_hour.index = last_hour.index + timedelta(1)
-            tw_df_lk = tw_df_lk.append(last_hour)
-            tw_df_lk = tw_df_lk.resample('H').pad()
+            tw_df_lk = pd.concat([tw_df_lk, last_hour])
+            tw_df_lk = tw_df_lk.resample('H').ffill()
             tw_df_lk = tw_df_lk[:-1]
 
             temp_cal = temp_calender_df.copy()
             temp_cal = temp_cal[['Date', 'Tagestyp', lk]].set_index("Date")
             last_hour = temp_cal.copy()[-1:]
             last_hour.index = last_hour.index + timedelta(1)
-            temp_cal = temp_cal.append(last_hour)
-            temp_cal = temp_cal.resample('H').pad()
+            temp_cal = pd.concat([temp_cal, last_hour])
+            temp_cal = temp_cal.resample('H').ffill()
             temp_cal = temp_cal[:-1]
             temp_cal['Stunde'] = pd.DatetimeIndex(temp_cal.index).time
             temp_cal = temp_cal.set_index(["Tagestyp", lk, 'Stunde'])
@@ -972,16 +1001,16 @@ def disagg_temporal_gas_households(use_nuts3code=False, how='top-down',
             tw_df_lk.index = pd.DatetimeIndex(tw_df_lk.index)
             last_hour = tw_df_lk.copy()[-1:]
             last_hour.index = last_hour.index + timedelta(1)
-            tw_df_lk = tw_df_lk.append(last_hour)
-            tw_df_lk = tw_df_lk.resample('H').pad()
+            tw_df_lk = pd.concat([tw_df_lk, last_hour])
+            tw_df_lk = tw_df_lk.resample('H').ffill()
             tw_df_lk = tw_df_lk[:-1]
 
             temp_cal = temp_calender_df.copy()
             temp_cal = temp_cal[['Date', 'Tagestyp', lk]].set_index("Date")
             last_hour = temp_cal.copy()[-1:]
             last_hour.index = last_hour.index + timedelta(1)
-            temp_cal = temp_cal.append(last_hour)
-            temp_cal = temp_cal.resample('H').pad()
+            temp_cal = pd.concat([temp_cal, last_hour])
+            temp_cal = temp_cal.resample('H').ffill()
             temp_cal = temp_cal[:-1]
             temp_cal['Stunde'] = pd.DatetimeIndex(temp_cal.index).time
             temp_cal = temp_cal.set_index(["Tagestyp", lk, 'Stunde'])
@@ -1068,7 +1097,7 @@ def disagg_temporal_industry(source, detailed=False, use_nuts3code=False,
             sv_lk_wz_ts = pd.DataFrame(index=idx)
         else:
             cols = sv_lk_wz.drop(columns=['SP']).columns
-            sv_lk_ts = pd.DataFrame(index=idx, columns=cols).fillna(0.0)
+            sv_lk_ts = pd.DataFrame(0.0, index=idx, columns=cols)
 
         logger.info('... assigning load-profiles to WZs')
         for sp in sv_lk_wz['SP'].unique():